@@ -1,19 +1,75 @@
 #!/usr/bin/env python3
 
+import hashlib
+import math
 import os
 import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+import PIL
 from PIL import Image
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 import argparse
 
 
+IMAGE_SIGNATURES = {
+    b'\x89PNG': 'PNG',
+    b'\xff\xd8\xff': 'JPEG',
+    b'GIF8': 'GIF',
+    b'BM': 'BMP',
+    b'II*\x00': 'TIFF',
+    b'MM\x00*': 'TIFF',
+}
+
+
+def sniff_image(image_path):
+    # One buffered read covers every signature we check
+    with open(image_path, 'rb', buffering=65536) as f:
+        sig = f.read(64)
+    
+    for magic, fmt in IMAGE_SIGNATURES.items():
+        if sig.startswith(magic):
+            return fmt
+    if sig[:4] == b'RIFF' and sig[8:12] == b'WEBP':
+        return 'WEBP'
+    return None
+
+
+def is_valid_image(image_path):
+    try:
+        if sniff_image(image_path):
+            return True
+    except OSError:
+        return False
+    
+    try:
+        with Image.open(image_path) as img:
+            img.verify()
+        return True
+    except:
+        return False
+
+
 class ImageToPdfConverter:
-    def __init__(self, page_size='A4', margin=0.5):
+    # Rows of images per page in the horizontal layout
+    HORIZONTAL_ROWS = 4
+    # Most recently used decoded images kept for reuse by repeated files;
+    # JPEG/RGB files are drawn by path and always kept
+    SOURCE_CACHE_SIZE = 32
+    
+    def __init__(self, page_size='A4', margin=0.5, compress=0):
         self.page_size = self._get_page_size(page_size)
         self.margin = margin * inch
+        # Images stay JPEG/Flate encoded either way; this only zips page content streams
+        self.compress = compress
+        self._pw, self._ph = self.page_size
+        self._uw = self._pw - 2 * self.margin
+        self._uh = self._ph - 2 * self.margin
         
     def _get_page_size(self, page_size):
         if page_size.upper() == 'A4':
@@ -30,50 +86,40 @@ class ImageToPdfConverter:
     
     def convert_single_image(self, image_path, output_path=None):
         try:
+            if output_path is None:
+                output_path = str(Path(image_path).with_suffix('.pdf'))
+            
             with Image.open(image_path) as img:
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    img = img.convert('RGB')
-                
-                img_width, img_height = img.size
-                page_width, page_height = self.page_size
-                
-                scale_x = (page_width - 2 * self.margin) / img_width
-                scale_y = (page_height - 2 * self.margin) / img_height
-                scale = min(scale_x, scale_y)
-                
-                final_width = img_width * scale
-                final_height = img_height * scale
-                x = (page_width - final_width) / 2
-                y = (page_height - final_height) / 2
-                
-                if output_path is None:
-                    output_path = str(Path(image_path).with_suffix('.pdf'))
-                
-                c = canvas.Canvas(output_path, pagesize=self.page_size)
-                c.drawImage(image_path, x, y, final_width, final_height)
-                c.save()
-                
-                print(f"✓ Converted: {image_path} → {output_path}")
-                return output_path
+                self._draw_single_page(output_path, self._build_image_source(img, image_path), img.size)
+            
+            print(f"✓ Converted: {image_path} → {output_path}")
+            return output_path
                 
         except Exception as e:
             print(f"✗ Error converting {image_path}: {str(e)}")
             return None
     
+    def _draw_single_page(self, output_path, image, size):
+        x, y, final_width, final_height = self._fit_image(
+            size, self._uw, self._uh, self._pw, self._ph)
+        
+        c = canvas.Canvas(output_path, pagesize=self.page_size, pageCompression=self.compress)
+        c.drawImage(image, x, y, final_width, final_height)
+        c.save()
+    
     def convert_multiple_images(self, image_paths, output_path, layout='vertical'):
         try:
-            c = canvas.Canvas(output_path, pagesize=self.page_size)
-            page_width, page_height = self.page_size
+            c = canvas.Canvas(output_path, pagesize=self.page_size, pageCompression=self.compress)
             
             if layout == 'vertical':
-                self._create_vertical_layout(c, image_paths, page_width, page_height)
+                self._create_vertical_layout(c, image_paths)
             elif layout == 'horizontal':
-                self._create_horizontal_layout(c, image_paths, page_width, page_height)
+                self._create_horizontal_layout(c, image_paths)
             elif layout == 'grid':
-                self._create_grid_layout(c, image_paths, page_width, page_height)
+                self._create_grid_layout(c, image_paths)
             else:
                 print(f"Unknown layout: {layout}. Using vertical layout.")
-                self._create_vertical_layout(c, image_paths, page_width, page_height)
+                self._create_vertical_layout(c, image_paths)
             
             c.save()
             print(f"✓ Created multi-image PDF: {output_path}")
@@ -83,37 +129,169 @@ class ImageToPdfConverter:
             print(f"✗ Error creating multi-image PDF: {str(e)}")
             return None
     
-    def _create_vertical_layout(self, canvas_obj, image_paths, page_width, page_height):
-        for i, img_path in enumerate(image_paths):
+    def _fit_image(self, size, box_width, box_height, outer_width, outer_height):
+        img_width, img_height = size
+        scale = min(box_width / img_width, box_height / img_height)
+        
+        final_width = img_width * scale
+        final_height = img_height * scale
+        x = (outer_width - final_width) / 2
+        y = (outer_height - final_height) / 2
+        return x, y, final_width, final_height
+    
+    def _create_vertical_layout(self, canvas_obj, image_paths):
+        for i, (img_path, decoded) in enumerate(self._decode_images(image_paths)):
             if i > 0:
                 canvas_obj.showPage()
             
             try:
-                with Image.open(img_path) as img:
-                    if img.mode in ('RGBA', 'LA', 'P'):
-                        img = img.convert('RGB')
-                    
-                    img_width, img_height = img.size
-                    scale_x = (page_width - 2 * self.margin) / img_width
-                    scale_y = (page_height - 2 * self.margin) / img_height
-                    scale = min(scale_x, scale_y)
-                    
-                    final_width = img_width * scale
-                    final_height = img_height * scale
-                    x = (page_width - final_width) / 2
-                    y = (page_height - final_height) / 2
-                    
-                    canvas_obj.drawImage(img_path, x, y, final_width, final_height)
+                source, size = decoded.result()
+                x, y, final_width, final_height = self._fit_image(
+                    size, self._uw, self._uh, self._pw, self._ph)
+                
+                canvas_obj.drawImage(source, x, y, final_width, final_height)
                     
             except Exception as e:
                 print(f"✗ Error processing {img_path}: {str(e)}")
                 continue
     
-    def _create_horizontal_layout(self, canvas_obj, image_paths, page_width, page_height):
-        self._create_vertical_layout(canvas_obj, image_paths, page_width, page_height)
+    def _content_key(self, img_path):
+        digest = hashlib.blake2b(digest_size=16)
+        with open(img_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        return digest.digest()
+    
+    def _decode_images(self, image_paths):
+        # PIL releases the GIL while decoding, so worker threads can hash and
+        # decode upcoming images while the caller draws the current one. Only a
+        # small window is in flight, so memory doesn't grow with the batch.
+        workers = min(8, os.cpu_count() or 1)
+        keys = {}
+        sources = {}
+        # Only decoded images cost memory, so only they are evicted; plain
+        # path sources are kept for the whole run
+        readers = OrderedDict()
+        lock = threading.Lock()
+        
+        def decode(img_path):
+            # Hash each distinct path once, however often it is repeated
+            with lock:
+                key = keys.get(img_path)
+            if key is None:
+                key = self._content_key(img_path)
+                with lock:
+                    keys[img_path] = key
+            
+            # Identical files share one source so the PDF embeds them only once.
+            # The first caller claims the key; later ones wait for its result
+            with lock:
+                slot = sources.get(key)
+                claimed = slot is None
+                if claimed:
+                    slot = sources[key] = Future()
+                elif key in readers:
+                    readers.move_to_end(key)
+            if not claimed:
+                return slot.result()
+            
+            try:
+                result = self._decode_and_convert(img_path)
+            except Exception as e:
+                slot.set_exception(e)
+                raise
+            slot.set_result(result)
+            
+            if isinstance(result[0], ImageReader):
+                with lock:
+                    readers[key] = None
+                    if len(readers) > self.SOURCE_CACHE_SIZE:
+                        oldest, _ = readers.popitem(last=False)
+                        sources.pop(oldest, None)
+            return result
+        
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            pending = deque()
+            for img_path in image_paths:
+                pending.append((img_path, ex.submit(decode, img_path)))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+    
+    def _decode_and_convert(self, img_path):
+        with Image.open(img_path) as img:
+            return self._build_image_source(img, img_path), img.size
+    
+    def _build_image_source(self, img, img_path):
+        # ReportLab embeds JPEGs and reads RGB images fine straight from the file;
+        # only images with alpha or a palette need converting here
+        if img.format == 'JPEG' or img.mode == 'RGB':
+            return img_path
+        
+        if img.mode in ('RGBA', 'LA', 'P'):
+            return ImageReader(img.convert('RGB'))
+        
+        # Copy so the pixels outlive the source file being closed
+        return ImageReader(img.copy())
+    
+    def _create_horizontal_layout(self, canvas_obj, image_paths):
+        row_height = self._uh / self.HORIZONTAL_ROWS
+        cursor_x = self.margin
+        row = 0
+        
+        # Scale every image to the same row height and fill rows left to right,
+        # moving to the next row (or page) when the next image doesn't fit
+        for img_path, decoded in self._decode_images(image_paths):
+            try:
+                source, size = decoded.result()
+                _, y, final_width, final_height = self._fit_image(
+                    size, self._uw, row_height, self._uw, row_height)
+                
+                if cursor_x > self.margin and cursor_x + final_width > self.margin + self._uw:
+                    cursor_x = self.margin
+                    row += 1
+                    if row == self.HORIZONTAL_ROWS:
+                        canvas_obj.showPage()
+                        row = 0
+                
+                row_y = self._ph - self.margin - (row + 1) * row_height
+                canvas_obj.drawImage(source, cursor_x, row_y + y, final_width, final_height)
+                cursor_x += final_width
+                    
+            except Exception as e:
+                print(f"✗ Error processing {img_path}: {str(e)}")
+                continue
     
-    def _create_grid_layout(self, canvas_obj, image_paths, page_width, page_height):
-        self._create_vertical_layout(canvas_obj, image_paths, page_width, page_height)
+    def _create_grid_layout(self, canvas_obj, image_paths):
+        n = len(image_paths)
+        if n == 0:
+            return
+        
+        cols = math.ceil(math.sqrt(n))
+        rows = math.ceil(n / cols)
+        per_page = rows * cols
+        cell_width = self._uw / cols
+        cell_height = self._uh / rows
+        
+        for i, (img_path, decoded) in enumerate(self._decode_images(image_paths)):
+            if i > 0 and i % per_page == 0:
+                canvas_obj.showPage()
+            
+            row, col = divmod(i % per_page, cols)
+            cell_x = self.margin + col * cell_width
+            cell_y = self._ph - self.margin - (row + 1) * cell_height
+            
+            try:
+                source, size = decoded.result()
+                x, y, final_width, final_height = self._fit_image(
+                    size, cell_width, cell_height, cell_width, cell_height)
+                
+                canvas_obj.drawImage(source, cell_x + x, cell_y + y, final_width, final_height)
+                    
+            except Exception as e:
+                print(f"✗ Error processing {img_path}: {str(e)}")
+                continue
 
 
 def main():
@@ -140,16 +318,23 @@ Examples:
                        help='Layout for multiple images')
     parser.add_argument('--margin', type=float, default=0.5,
                        help='Margin in inches (default: 0.5)')
+    parser.add_argument('--compress', type=int, default=0, choices=[0, 1],
+                       help='Compress PDF page streams (default: 0)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                       help='Show performance hints')
     
     args = parser.parse_args()
     
+    # Pillow-SIMD releases are tagged with a ".postN" suffix
+    if args.verbose and 'post' not in PIL.__version__:
+        print("Tip: install pillow-simd instead of Pillow for faster image conversion")
+    
     valid_images = []
     for img_path in args.images:
         if os.path.isfile(img_path):
-            try:
-                with Image.open(img_path) as img:
-                    valid_images.append(img_path)
-            except:
+            if is_valid_image(img_path):
+                valid_images.append(img_path)
+            else:
                 print(f"✗ Skipping {img_path}: Not a valid image file")
         else:
             print(f"✗ Skipping {img_path}: File not found")
@@ -158,7 +343,7 @@ Examples:
         print("No valid image files found!")
         return
     
-    converter = ImageToPdfConverter(page_size=args.size, margin=args.margin)
+    converter = ImageToPdfConverter(page_size=args.size, margin=args.margin, compress=args.compress)
     
     if len(valid_images) == 1 and not args.multiple:
         converter.convert_single_image(valid_images[0], args.output)
@@ -1,7 +1,11 @@
 # main.py (skeleton)
 import argparse
 import os
-from word_to_pdf import convert_word_to_pdf
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from word_to_pdf import (convert_word_to_pdf, convert_with_libreoffice_batch,
+                         is_linux, use_private_lo_profile)
 from pdf_to_word import convert_pdf_to_word
 
 def parse_args():
@@ -20,16 +24,67 @@ def process_single(mode, inp, out):
     else:
         convert_pdf_to_word(inp, out)
 
+def _convert_one(mode, src, out):
+    if mode == 'word2pdf':
+        ok = convert_word_to_pdf(src, out)
+    else:
+        # files already run in parallel, don't split pages across more processes
+        ok = convert_pdf_to_word(src, out, multi_processing=False)
+    return src, ok
+
+def _convert_in_pool(mode, srcs, outs):
+    if not srcs:
+        return []
+    # Windows can't run more than 61 pool workers
+    workers = min(len(srcs), os.cpu_count() or 1, 61)
+    profile_root = tempfile.mkdtemp(prefix='easy_converter_lo_')
+    try:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=use_private_lo_profile,
+                                 initargs=(profile_root,)) as ex:
+            return list(ex.map(_convert_one, [mode] * len(srcs), srcs, outs))
+    finally:
+        shutil.rmtree(profile_root, ignore_errors=True)
+
 def process_batch(mode, input_folder, output_folder):
     os.makedirs(output_folder, exist_ok=True)
-    for fname in os.listdir(input_folder):
-        src = os.path.join(input_folder, fname)
-        if mode == 'word2pdf' and fname.lower().endswith(('.docx','.doc')):
-            out = os.path.join(output_folder, os.path.splitext(fname)[0] + '.pdf')
-            convert_word_to_pdf(src, out)
+    srcs, outs = [], []
+    # scandir entries carry the file type, so no extra stat per file
+    with os.scandir(input_folder) as it:
+        entries = [(e.name, e.path) for e in it if e.is_file()]
+    for fname, src in entries:
+        if mode == 'word2pdf' and fname.lower().endswith('.docx'):
+            srcs.append(src)
+            outs.append(os.path.join(output_folder, os.path.splitext(fname)[0] + '.pdf'))
         if mode == 'pdf2word' and fname.lower().endswith('.pdf'):
-            out = os.path.join(output_folder, os.path.splitext(fname)[0] + '.docx')
-            convert_pdf_to_word(src, out)
+            srcs.append(src)
+            outs.append(os.path.join(output_folder, os.path.splitext(fname)[0] + '.docx'))
+    if not srcs:
+        return []
+    # LibreOffice takes a whole list of inputs, so pay its startup cost only once
+    if mode == 'word2pdf' and is_linux():
+        # an older file from a previous run doesn't count as converted
+        previous = {out: os.path.getmtime(out) for out in outs if os.path.exists(out)}
+        if not convert_with_libreoffice_batch(srcs, output_folder):
+            print("Batch LibreOffice conversion failed, converting files one by one...")
+            return _convert_in_pool(mode, srcs, outs)
+        # LibreOffice can exit cleanly while skipping some inputs, so retry those
+        # one by one, which also gets them the python-docx fallback
+        done, missing = [], []
+        for src, out in zip(srcs, outs):
+            if os.path.exists(out) and os.path.getmtime(out) != previous.get(out):
+                done.append((src, True))
+            else:
+                missing.append((src, out))
+        if missing:
+            print(f"{len(missing)} file(s) were not converted by LibreOffice, retrying one by one...")
+            done += _convert_in_pool(mode, [src for src, _ in missing], [out for _, out in missing])
+        return done
+    # Word automation over COM can't run concurrently, so docx2pdf goes one file at a time
+    if mode == 'word2pdf' and not is_linux():
+        return [_convert_one(mode, src, out) for src, out in zip(srcs, outs)]
+    # each conversion is independent, so run them side by side
+    return _convert_in_pool(mode, srcs, outs)
 
 if __name__ == '__main__':
     args = parse_args()
@@ -1,43 +1,115 @@
 import sys
 import os
 import argparse
+import tempfile
+from copy import deepcopy
 from pathlib import Path
 
 try:
+    import fitz
     from pdf2docx import Converter
 except ImportError:
     print("Error: Required library 'pdf2docx' not found.")
     print("Install it using: pip install pdf2docx")
     sys.exit(1)
 
+# Large PDFs are converted this many pages at a time to bound memory use
+PAGES_PER_PART = 50
+# Below this many pages, starting pdf2docx's process pool costs more than it saves
+MULTI_PROCESSING_MIN_PAGES = 20
 
-def convert_pdf_to_word(input_path, output_path=None):
+
+def _convert_range(input_path, output_path, start, end, multi_processing):
+    # Absolute paths, since the multi-processing path changes directory
+    input_path = os.path.abspath(input_path)
+    output_path = os.path.abspath(output_path)
+    cv = Converter(input_path)
+    try:
+        # Older pdf2docx releases have no multi-processing settings
+        if multi_processing and 'multi_processing' in getattr(cv, 'default_settings', {}):
+            # pdf2docx writes its per-process pages-N.json files to the working
+            # directory, so run it from a private one
+            cwd = os.getcwd()
+            with tempfile.TemporaryDirectory() as work_dir:
+                os.chdir(work_dir)
+                try:
+                    cv.convert(output_path, start=start, end=end, pages=None,
+                               multi_processing=True, cpu_count=os.cpu_count())
+                finally:
+                    os.chdir(cwd)
+        else:
+            cv.convert(output_path, start=start, end=end)
+    finally:
+        cv.close()
+
+
+def _convert_in_parts(input_path, output_path, page_count, multi_processing):
+    """Convert a large PDF in page ranges and merge the parts into one DOCX."""
+    try:
+        from docx import Document
+        from docx.enum.section import WD_SECTION
+        from docxcompose.composer import Composer
+    except ImportError:
+        return False
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        parts = []
+        for start in range(0, page_count, PAGES_PER_PART):
+            part = os.path.join(tmp_dir, f"part_{start}.docx")
+            end = min(start + PAGES_PER_PART, page_count)
+            _convert_range(input_path, part, start, end,
+                           multi_processing and end - start >= MULTI_PROCESSING_MIN_PAGES)
+            parts.append(part)
+
+        composer = Composer(Document(parts[0]))
+        for part in parts[1:]:
+            part_doc = Document(part)
+            # Each part's last page is set up by its body-level sectPr, which
+            # docxcompose drops on append: close the current page in its own
+            # section first, then carry over the appended part's page setup
+            composer.doc.add_section(WD_SECTION.NEW_PAGE)
+            composer.append(part_doc)
+            body = composer.doc.element.body
+            body.replace(body.sectPr, deepcopy(part_doc.element.body.sectPr))
+            composer.doc.sections[-1].start_type = WD_SECTION.NEW_PAGE
+        composer.save(output_path)
+    return True
+
+
+def convert_pdf_to_word(input_path, output_path=None, multi_processing=True):
     """Convert PDF to Word document using pdf2docx library."""
     try:
-        input_path = Path(input_path)
+        input_path = str(input_path)
         
-        if not input_path.exists():
+        if not os.path.exists(input_path):
             print(f"Error: Input file '{input_path}' not found.")
             return False
             
-        if not input_path.suffix.lower() == '.pdf':
+        if not input_path.lower().endswith('.pdf'):
             print("Error: Input file must be a PDF file.")
             return False
 
         if output_path is None:
-            output_path = input_path.with_suffix('.docx')
+            output_path = str(Path(input_path).with_suffix('.docx'))
         else:
-            output_path = Path(output_path)
+            output_path = str(output_path)
             
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
 
         print(f"Converting '{input_path}' to '{output_path}'...")
 
-        cv = Converter(str(input_path))
-        cv.convert(str(output_path), start=0, end=None)
-        cv.close()
+        with fitz.open(input_path) as doc:
+            page_count = doc.page_count
+        multi_processing = multi_processing and page_count >= MULTI_PROCESSING_MIN_PAGES
+
+        # Merging parts needs docxcompose; without it convert in one pass
+        if not (page_count > PAGES_PER_PART and
+                _convert_in_parts(input_path, output_path, page_count, multi_processing)):
+            _convert_range(input_path, output_path, 0, None, multi_processing)
 
-        if output_path.exists():
+        if os.path.exists(output_path):
             print(f"Success! Word file saved as: {output_path}")
             return True
         else:
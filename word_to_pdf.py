@@ -5,13 +5,48 @@ import subprocess
 import platform
 from pathlib import Path
 
+# The OS can't change while running, so look it up once
+_SYS = platform.system().lower()
+IS_WINDOWS = _SYS == 'windows'
+IS_LINUX = _SYS == 'linux'
+
 def is_windows():
     """Check if running on Windows"""
-    return platform.system().lower() == 'windows'
+    return IS_WINDOWS
 
 def is_linux():
     """Check if running on Linux"""
-    return platform.system().lower() == 'linux'
+    return IS_LINUX
+
+_LO_AVAILABLE = None
+
+def _lo_available():
+    """Check once per process whether LibreOffice can be run"""
+    global _LO_AVAILABLE
+    if _LO_AVAILABLE is None:
+        try:
+            result = subprocess.run(['libreoffice', '--version'],
+                                    capture_output=True, text=True)
+            _LO_AVAILABLE = result.returncode == 0
+        except OSError:
+            _LO_AVAILABLE = False
+    return _LO_AVAILABLE
+
+# Only set in batch pool workers, so concurrent LibreOffice runs don't share a profile lock
+_LO_PROFILE_DIR = None
+
+def use_private_lo_profile(parent_dir):
+    """Give this process its own LibreOffice profile under parent_dir"""
+    global _LO_PROFILE_DIR
+    _LO_PROFILE_DIR = os.path.join(parent_dir, f"lo_{os.getpid()}")
+
+def _lo_command(*args):
+    """Build a LibreOffice command line, using the private profile if one is set"""
+    cmd = ['libreoffice']
+    if _LO_PROFILE_DIR:
+        cmd.append(f'-env:UserInstallation={Path(_LO_PROFILE_DIR).as_uri()}')
+    cmd.extend(args)
+    return cmd
 
 # Windows Method: Using docx2pdf (requires Microsoft Word)
 def convert_with_docx2pdf(input_path, output_path=None):
@@ -54,9 +89,7 @@ def convert_with_libreoffice(input_path, output_path=None):
     """Convert using LibreOffice headless mode on Linux"""
     try:
         # Check if LibreOffice is installed
-        result = subprocess.run(['libreoffice', '--version'], 
-                              capture_output=True, text=True)
-        if result.returncode != 0:
+        if not _lo_available():
             print("Error: LibreOffice is not installed. Install it with:")
             print("sudo apt-get install libreoffice")
             return False
@@ -71,13 +104,12 @@ def convert_with_libreoffice(input_path, output_path=None):
         print(f"Converting '{input_path}' to '{output_path}' using LibreOffice (Linux)...")
         
         # Convert using LibreOffice headless
-        cmd = [
-            'libreoffice',
+        cmd = _lo_command(
             '--headless',
             '--convert-to', 'pdf',
             '--outdir', str(output_dir),
             input_path
-        ]
+        )
         
         result = subprocess.run(cmd, capture_output=True, text=True)
         
@@ -86,6 +118,11 @@ def convert_with_libreoffice(input_path, output_path=None):
             input_name = Path(input_path).stem
             generated_pdf = output_dir / f"{input_name}.pdf"
             
+            # LibreOffice exits cleanly even when it couldn't convert the file
+            if not generated_pdf.exists():
+                print("Error: Conversion failed - output file not created.")
+                return False
+            
             # Rename to desired output name if different
             if generated_pdf != Path(output_path):
                 generated_pdf.rename(output_path)
@@ -100,6 +137,38 @@ def convert_with_libreoffice(input_path, output_path=None):
         print(f"Error during LibreOffice conversion: {str(e)}")
         return False
 
+def convert_with_libreoffice_batch(input_paths, output_folder):
+    """Convert many documents in one LibreOffice run to avoid per-file startup"""
+    try:
+        if not _lo_available():
+            print("Error: LibreOffice is not installed. Install it with:")
+            print("sudo apt-get install libreoffice")
+            return False
+        
+        output_dir = Path(output_folder)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        print(f"Converting {len(input_paths)} file(s) into '{output_dir}' using LibreOffice (Linux)...")
+        
+        cmd = _lo_command(
+            '--headless',
+            '--convert-to', 'pdf',
+            '--outdir', str(output_dir),
+            *[str(p) for p in input_paths]
+        )
+        
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            return True
+        else:
+            print(f"Error: {result.stderr}")
+            return False
+            
+    except Exception as e:
+        print(f"Error during LibreOffice batch conversion: {str(e)}")
+        return False
+
 # Linux Method 2: Using python-docx + reportlab (fallback for Linux)
 def convert_with_python_libs(input_path, output_path=None):
     """Convert using python-docx and reportlab (basic conversion for Linux)"""
@@ -108,6 +177,7 @@ def convert_with_python_libs(input_path, output_path=None):
         from reportlab.lib.pagesizes import letter
         from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
         from reportlab.lib.styles import getSampleStyleSheet
+        from xml.sax.saxutils import escape
         
         # Generate output path if not provided
         if output_path is None:
@@ -124,12 +194,25 @@ def convert_with_python_libs(input_path, output_path=None):
         styles = getSampleStyleSheet()
         story = []
         
-        # Extract text from DOCX and add to PDF
+        # Extract text from DOCX and add to PDF, grouping paragraphs into
+        # larger flowables so reportlab has fewer objects to lay out
+        chunks = []
+        chunk_size = 0
+        
+        def flush():
+            if chunks:
+                story.append(Paragraph('<br/><br/>'.join(chunks), styles['Normal']))
+                story.append(Spacer(1, 12))
+                chunks.clear()
+        
         for paragraph in doc.paragraphs:
             if paragraph.text.strip():
-                p = Paragraph(paragraph.text, styles['Normal'])
-                story.append(p)
-                story.append(Spacer(1, 12))
+                chunks.append(escape(paragraph.text))
+                chunk_size += len(chunks[-1])
+                if len(chunks) >= 100 or chunk_size >= 8192:
+                    flush()
+                    chunk_size = 0
+        flush()
         
         pdf_doc.build(story)
         
@@ -161,11 +244,12 @@ def convert_word_to_pdf(input_path, output_path=None, method='auto'):
     
     # Ensure output directory exists
     if output_path:
-        output_dir = Path(output_path).parent
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
     
     # Detect platform and choose method
-    current_os = platform.system().lower()
+    current_os = _SYS
     print(f"Detected OS: {current_os}")
     
     if method == 'auto':